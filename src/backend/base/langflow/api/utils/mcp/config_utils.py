@@ -1,26 +1,38 @@
 import asyncio
+import logging
 import platform
+import re
 from asyncio.subprocess import create_subprocess_exec
+from collections import defaultdict
+from collections.abc import Mapping
 from datetime import datetime, timezone
+from functools import cache
+from types import MappingProxyType
 from uuid import UUID
 
-from fastapi import HTTPException
 from lfx.base.mcp.constants import MAX_MCP_SERVER_NAME_LENGTH
 from lfx.base.mcp.util import sanitize_mcp_name
 from lfx.log import logger
 from lfx.services.deps import get_settings_service
-from sqlmodel import select
+from sqlmodel import col, select
 
 from langflow.api.v2.mcp import get_server_list, update_server
 from langflow.services.auth.mcp_encryption import encrypt_auth_settings
 from langflow.services.database.models import Flow, Folder
-from langflow.services.database.models.api_key.crud import create_api_key
+from langflow.services.database.models.api_key.crud import create_api_key, create_api_keys
 from langflow.services.database.models.api_key.model import ApiKeyCreate
 from langflow.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
 from langflow.services.database.models.user.model import User
-from langflow.services.deps import get_storage_service
+from langflow.services.deps import get_storage_service, session_scope
 
-ALL_INTERFACES_HOST = "0.0.0.0"  # noqa: S104
+# Maximum number of users whose starter projects MCP server is configured at the same time
+MAX_CONCURRENT_USER_CONFIGURATIONS = 8
+# Shared immutable fallback for server lists without an "mcpServers" section
+_EMPTY_MAPPING: Mapping = MappingProxyType({})
+# Matches http/https URLs
+URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+[^\s<>"{}|\\^`\[\].,;:!?]')
+# Matches the project UUID path segment of a project's MCP endpoint URL
+PROJECT_URL_PATTERN = re.compile(r"/mcp/project/([0-9a-fA-F-]{36})(?:[/?#]|$)")
 
 
 class MCPServerValidationResult:
@@ -46,6 +58,8 @@ class MCPServerValidationResult:
         or proceeding with the setup.
     """
 
+    __slots__ = ("conflict_message", "existing_config", "project_id_matches", "server_exists", "server_name")
+
     def __init__(
         self,
         *,
@@ -95,6 +109,9 @@ async def validate_mcp_server_for_project(
     storage_service,
     settings_service,
     operation: str = "create",
+    *,
+    existing_servers: dict | None = None,
+    precomputed_server_name: str | None = None,
 ) -> MCPServerValidationResult:
     """Validate MCP server for a project operation.
 
@@ -106,17 +123,21 @@ async def validate_mcp_server_for_project(
         storage_service: Storage service
         settings_service: Settings service
         operation: Operation type ("create", "update", "delete")
+        existing_servers: The user's already loaded MCP server list, fetched if not provided
+        precomputed_server_name: The server name for the project, derived from project_name if not provided
 
     Returns:
         MCPServerValidationResult with validation details
     """
     # Generate server name that would be used for this project
-    server_name = f"lf-{sanitize_mcp_name(project_name)[: (MAX_MCP_SERVER_NAME_LENGTH - 4)]}"
+    server_name = precomputed_server_name or f"lf-{sanitize_mcp_name(project_name)[: (MAX_MCP_SERVER_NAME_LENGTH - 4)]}"
 
     try:
-        existing_servers = await get_server_list(user, session, storage_service, settings_service)
+        if existing_servers is None:
+            existing_servers = await get_server_list(user, session, storage_service, settings_service)
 
-        if server_name not in existing_servers.get("mcpServers", {}):
+        mcp_servers = existing_servers.get("mcpServers") or _EMPTY_MAPPING
+        if server_name not in mcp_servers:
             # Server doesn't exist
             return MCPServerValidationResult(
                 project_id_matches=False,
@@ -125,7 +146,7 @@ async def validate_mcp_server_for_project(
             )
 
         # Server exists - check if project ID matches
-        existing_server_config = existing_servers["mcpServers"][server_name]
+        existing_server_config = mcp_servers[server_name]
         existing_args = existing_server_config.get("args", [])
         project_id_matches = False
 
@@ -133,12 +154,12 @@ async def validate_mcp_server_for_project(
             # SSE URL is typically the last argument
             # TODO: Better way Required to check the postion of the SSE URL in the args
             existing_sse_urls = await extract_urls_from_strings(existing_args)
+            project_id_str = str(project_id).lower()
             for existing_sse_url in existing_sse_urls:
-                if str(project_id) in existing_sse_url:
+                match = PROJECT_URL_PATTERN.search(existing_sse_url)
+                if match and match.group(1).lower() == project_id_str:
                     project_id_matches = True
                     break
-        else:
-            project_id_matches = False
 
         # Generate appropriate conflict message based on operation
         conflict_message = ""
@@ -178,23 +199,45 @@ async def validate_mcp_server_for_project(
         )
 
 
-async def get_url_by_os(host: str, port: int, url: str) -> str:
-    """Get the URL by operating system."""
-    os_type = platform.system()
-    is_wsl = os_type == "Linux" and "microsoft" in platform.uname().release.lower()
+@cache
+def _is_wsl() -> bool:
+    """Return True when running under Windows Subsystem for Linux."""
+    return platform.system() == "Linux" and "microsoft" in platform.uname().release.lower()
 
-    if is_wsl and host in {"localhost", "127.0.0.1"}:
-        try:
+
+# The WSL IP address does not change within a process, so it is resolved at most once
+_wsl_ip_cache: dict[str, str] = {}
+_wsl_ip_lock = asyncio.Lock()
+
+
+async def _get_wsl_ip() -> str | None:
+    """Get the first IP address of the WSL instance, caching it for the lifetime of the process."""
+    if "ip" in _wsl_ip_cache:
+        return _wsl_ip_cache["ip"]
+
+    async with _wsl_ip_lock:
+        if "ip" not in _wsl_ip_cache:
             proc = await create_subprocess_exec(
                 "/usr/bin/hostname",
                 "-I",
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
             stdout, _ = await proc.communicate()
 
-            if proc.returncode == 0 and stdout.strip():
-                wsl_ip = stdout.decode().strip().split()[0]  # Get first IP address
+            ip_addresses = stdout.split(maxsplit=1)
+            if proc.returncode == 0 and ip_addresses:
+                _wsl_ip_cache["ip"] = ip_addresses[0].decode()  # Get first IP address
+
+    return _wsl_ip_cache.get("ip")
+
+
+async def get_url_by_os(host: str, port: int, url: str) -> str:
+    """Get the URL by operating system."""
+    if _is_wsl() and host in {"localhost", "127.0.0.1"}:
+        try:
+            wsl_ip = await _get_wsl_ip()
+            if wsl_ip:
                 await logger.adebug("Using WSL IP for external access: %s", wsl_ip)
                 # Replace the localhost with the WSL IP in the URL
                 url = url.replace(f"http://{host}:{port}", f"http://{wsl_ip}:{port}")
@@ -206,25 +249,210 @@ async def get_url_by_os(host: str, port: int, url: str) -> str:
 
 async def get_project_sse_url(project_id: UUID) -> str:
     """Generate the SSE URL for a project, including WSL handling."""
-    # Get settings service to build the SSE URL
-    settings_service = get_settings_service()
-    server_host = getattr(settings_service.settings, "host", "localhost")
-    # Use the runtime-detected port if available, otherwise fall back to configured port
-    server_port = (
-        getattr(settings_service.settings, "runtime_port", None)
-        or getattr(settings_service.settings, "port", None)
-        or 7860
-    )
+    settings = get_settings_service().settings
+    host = settings.effective_mcp_host
+    port = settings.effective_mcp_port
+    project_sse_url = f"http://{host}:{port}/api/v1/mcp/project/{project_id}/sse"
+
+    return await get_url_by_os(host, port, project_sse_url)
 
-    # For MCP clients, always use localhost instead of 0.0.0.0
-    # 0.0.0.0 is a bind address, not a connect address
-    host = "localhost" if server_host == ALL_INTERFACES_HOST else server_host
-    port = server_port
 
-    base_url = f"http://{host}:{port}".rstrip("/")
-    project_sse_url = f"{base_url}/api/v1/mcp/project/{project_id}/sse"
+def _enable_mcp_for_starter_flows(flows: list[Flow], session) -> int:
+    """Enable MCP for starter flows that have not been configured yet.
 
-    return await get_url_by_os(host, port, project_sse_url)
+    Returns:
+        The number of flows that were updated.
+    """
+    flows_configured = 0
+    for flow in flows:
+        if flow.mcp_enabled is None:
+            flow.mcp_enabled = True
+            if not flow.action_name:
+                flow.action_name = sanitize_mcp_name(flow.name)
+            if not flow.action_description:
+                flow.action_description = flow.description or f"Starter project: {flow.name}"
+            flow.updated_at = datetime.now(timezone.utc)
+            session.add(flow)
+            flows_configured += 1
+    return flows_configured
+
+
+async def _needs_starter_server(
+    user,
+    user_starter_folder: Folder | None,
+    server_name: str,
+    settings_service,
+    semaphore: asyncio.Semaphore,
+) -> bool:
+    """Check whether a user's starter projects MCP server still has to be added.
+
+    Each call runs in its own database session so users can be checked concurrently.
+
+    Returns:
+        True if the server has to be added for the user, False otherwise.
+    """
+    async with semaphore:
+        await logger.adebug(f"Processing user: {user.username} (ID: {user.id})")
+        try:
+            if not user_starter_folder:
+                await logger.adebug(
+                    f"No starter projects folder ('{DEFAULT_FOLDER_NAME}') found for user {user.username}, skipping"
+                )
+                # Log what folders this user does have for debugging, only querying them if it will be logged
+                if logger.is_enabled_for(logging.DEBUG):
+                    async with session_scope() as session:
+                        all_user_folders = (await session.exec(select(Folder).where(Folder.user_id == user.id))).all()
+                    folder_names = [f.name for f in all_user_folders]
+                    await logger.adebug(f"User {user.username} available folders: {folder_names}")
+                return False
+
+            await logger.adebug(
+                f"Found starter folder '{user_starter_folder.name}' for {user.username}: ID={user_starter_folder.id}"
+            )
+
+            async with session_scope() as session:
+                # Load the user's server list once and reuse it for validation
+                storage_service = get_storage_service()
+                existing_servers = await get_server_list(user, session, storage_service, settings_service)
+
+                # Validate MCP server for this starter projects folder
+                validation_result = await validate_mcp_server_for_project(
+                    user_starter_folder.id,
+                    DEFAULT_FOLDER_NAME,
+                    user,
+                    session,
+                    storage_service,
+                    settings_service,
+                    operation="create",
+                    existing_servers=existing_servers,
+                    precomputed_server_name=server_name,
+                )
+
+            # Skip if server already exists for this starter projects folder
+            if validation_result.should_skip:
+                await logger.adebug(
+                    f"MCP server '{validation_result.server_name}' already exists for user "
+                    f"{user.username}'s starter projects (project ID: "
+                    f"{user_starter_folder.id}), skipping"
+                )
+                return False  # Skip this user since server already exists for the same project
+
+        except Exception as e:  # noqa: BLE001
+            # If server already exists or other issues, just log and continue
+            await logger.aerror(f"Could not add starter projects MCP server for user {user.username}: {e}")
+            return False
+
+        return True
+
+
+async def _get_starter_folder_auth(user, user_starter_folder: Folder, settings_service) -> dict:
+    """Get the auth settings for a user's starter folder, enabling API key auth when AUTO_LOGIN is off."""
+    # Set up THIS USER'S starter folder authentication (same as new projects)
+    # If AUTO_LOGIN is false, automatically enable API key authentication
+    default_auth = {"auth_type": "none"}
+    await logger.adebug(f"Settings service auth settings: {settings_service.auth_settings}")
+    await logger.adebug(f"User starter folder auth settings: {user_starter_folder.auth_settings}")
+    if not settings_service.auth_settings.AUTO_LOGIN and not user_starter_folder.auth_settings:
+        default_auth = {"auth_type": "apikey"}
+        user_starter_folder.auth_settings = encrypt_auth_settings(default_auth)
+        await logger.adebug(f"Set up auth settings for user {user.username}'s starter folder")
+    elif user_starter_folder.auth_settings:
+        default_auth = user_starter_folder.auth_settings
+    return default_auth
+
+
+async def _create_starter_api_keys(users: list[User]) -> dict[UUID, str]:
+    """Create the API keys users need to access their own starter projects.
+
+    All keys are created in one transaction. If that fails, they are created one user at a time
+    so that a failure for one user only skips that user.
+
+    Returns:
+        The unmasked API key of every user a key could be created for, by user ID.
+    """
+    api_keys_create = [
+        (ApiKeyCreate(name=f"MCP Project {DEFAULT_FOLDER_NAME} - {user.username}"), user.id) for user in users
+    ]
+    try:
+        async with session_scope() as session:
+            unmasked_api_keys = await create_api_keys(session, api_keys_create)
+    except Exception as e:  # noqa: BLE001
+        await logger.awarning(f"Could not create starter projects API keys in one transaction, retrying per user: {e}")
+    else:
+        return {user.id: unmasked.api_key for user, unmasked in zip(users, unmasked_api_keys, strict=True)}
+
+    api_keys = {}
+    for user, (api_key_create, user_id) in zip(users, api_keys_create, strict=True):
+        try:
+            async with session_scope() as session:
+                unmasked_api_key = await create_api_key(session, api_key_create, user_id)
+        except Exception as e:  # noqa: BLE001
+            await logger.aerror(f"Could not add starter projects MCP server for user {user.username}: {e}")
+        else:
+            api_keys[user.id] = unmasked_api_key.api_key
+    return api_keys
+
+
+async def _add_starter_server(
+    user,
+    user_starter_folder: Folder,
+    server_name: str,
+    default_auth: dict,
+    api_key: str,
+    settings_service,
+    semaphore: asyncio.Semaphore,
+) -> bool:
+    """Add the starter projects MCP server to a single user's configuration.
+
+    Each call runs in its own database session so servers can be added concurrently.
+
+    Returns:
+        True if the MCP server was added for the user, False otherwise.
+    """
+    async with semaphore:
+        try:
+            # Build SSE URL for THIS USER'S starter folder (unique ID per user)
+            sse_url = await get_project_sse_url(user_starter_folder.id)
+
+            # Prepare server config (similar to new project creation)
+            if default_auth.get("auth_type", "none") == "apikey":
+                command = "uvx"
+                args = [
+                    "mcp-proxy",
+                    "--headers",
+                    "x-api-key",
+                    api_key,
+                    sse_url,
+                ]
+            else:  # default_auth_type == "none"
+                # No authentication - direct connection
+                command = "uvx"
+                args = [
+                    "mcp-proxy",
+                    sse_url,
+                ]
+            server_config = {"command": command, "args": args}
+
+            # Add to user's MCP servers configuration
+            await logger.adebug(f"Adding MCP server '{server_name}' for user {user.username}")
+            async with session_scope() as session:
+                await update_server(
+                    server_name,
+                    server_config,
+                    user,
+                    session,
+                    get_storage_service(),
+                    settings_service,
+                )
+
+            await logger.adebug(f"Added starter projects MCP server for user: {user.username}")
+
+        except Exception as e:  # noqa: BLE001
+            # If server already exists or other issues, just log and continue
+            await logger.aerror(f"Could not add starter projects MCP server for user {user.username}: {e}")
+            return False
+
+        return True
 
 
 async def auto_configure_starter_projects_mcp(session):
@@ -250,144 +478,102 @@ async def auto_configure_starter_projects_mcp(session):
             await logger.adebug("No users found, skipping starter project MCP configuration")
             return
 
-        # Add starter projects to each user's MCP server configuration
-        total_servers_added = 0
+        # Fetch every user's own starter projects folder and its flows in two queries
+        # Each user has their own "Starter Projects" folder with unique ID
+        starter_folders = (
+            await session.exec(
+                select(Folder).where(
+                    Folder.name == DEFAULT_FOLDER_NAME,
+                    col(Folder.user_id).in_([user.id for user in users]),
+                )
+            )
+        ).all()
+        folder_by_user = {folder.user_id: folder for folder in starter_folders}
+
+        flows_by_folder: defaultdict[UUID, list[Flow]] = defaultdict(list)
+        if starter_folders:
+            flows_query = select(Flow).where(
+                col(Flow.folder_id).in_([folder.id for folder in starter_folders]),
+                Flow.is_component == False,  # noqa: E712
+            )
+            for flow in (await session.exec(flows_query)).all():
+                flows_by_folder[flow.folder_id].append(flow)
+
+        # Enable MCP for starter flows if not already configured
         for user in users:
-            await logger.adebug(f"Processing user: {user.username} (ID: {user.id})")
-            try:
-                # First, let's see what folders this user has
-                all_user_folders = (await session.exec(select(Folder).where(Folder.user_id == user.id))).all()
-                folder_names = [f.name for f in all_user_folders]
-                await logger.adebug(f"User {user.username} has folders: {folder_names}")
-
-                # Find THIS USER'S own starter projects folder
-                # Each user has their own "Starter Projects" folder with unique ID
-                user_starter_folder = (
-                    await session.exec(
-                        select(Folder).where(
-                            Folder.name == DEFAULT_FOLDER_NAME,
-                            Folder.user_id == user.id,  # Each user has their own!
-                        )
-                    )
-                ).first()
-                if not user_starter_folder:
-                    await logger.adebug(
-                        f"No starter projects folder ('{DEFAULT_FOLDER_NAME}') found for user {user.username}, skipping"
-                    )
-                    # Log what folders this user does have for debugging
-                    await logger.adebug(f"User {user.username} available folders: {folder_names}")
-                    continue
+            user_starter_folder = folder_by_user.get(user.id)
+            if user_starter_folder is None:
+                continue
+            flows_configured = _enable_mcp_for_starter_flows(flows_by_folder[user_starter_folder.id], session)
+            if flows_configured > 0:
+                await logger.adebug(f"Enabled MCP for {flows_configured} starter flows for user {user.username}")
 
-                await logger.adebug(
-                    f"Found starter folder '{user_starter_folder.name}' for {user.username}: "
-                    f"ID={user_starter_folder.id}"
-                )
+        # Every user's starter projects server shares the same name
+        server_name = f"lf-{sanitize_mcp_name(DEFAULT_FOLDER_NAME)[: (MAX_MCP_SERVER_NAME_LENGTH - 4)]}"
 
-                # Configure MCP settings for flows in THIS USER'S starter folder
-                flows_query = select(Flow).where(
-                    Flow.folder_id == user_starter_folder.id,
-                    Flow.is_component == False,  # noqa: E712
-                )
-                user_starter_flows = (await session.exec(flows_query)).all()
-
-                # Enable MCP for starter flows if not already configured
-                flows_configured = 0
-                for flow in user_starter_flows:
-                    if flow.mcp_enabled is None:
-                        flow.mcp_enabled = True
-                        if not flow.action_name:
-                            flow.action_name = sanitize_mcp_name(flow.name)
-                        if not flow.action_description:
-                            flow.action_description = flow.description or f"Starter project: {flow.name}"
-                        flow.updated_at = datetime.now(timezone.utc)
-                        session.add(flow)
-                        flows_configured += 1
-
-                if flows_configured > 0:
-                    await logger.adebug(f"Enabled MCP for {flows_configured} starter flows for user {user.username}")
+        # Commit the enabled flows and any changes the caller staged (e.g. project auth settings from
+        # init_mcp_servers) first. Otherwise this session may hold the SQLite write lock and block the
+        # per-user sessions below, which write when they upload or migrate a server config.
+        await session.commit()
 
-                # Validate MCP server for this starter projects folder
-                validation_result = await validate_mcp_server_for_project(
-                    user_starter_folder.id,
-                    DEFAULT_FOLDER_NAME,
-                    user,
-                    session,
-                    get_storage_service(),
-                    settings_service,
-                    operation="create",
+        # Check concurrently which users still need the starter projects server.
+        # Each user is checked in its own session, bounded by a semaphore.
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_USER_CONFIGURATIONS)
+        results = await asyncio.gather(
+            *(
+                _needs_starter_server(user, folder_by_user.get(user.id), server_name, settings_service, semaphore)
+                for user in users
+            ),
+            return_exceptions=True,
+        )
+
+        pending_users = []
+        auth_by_user = {}
+        for user, needs_server in zip(users, results, strict=True):
+            if isinstance(needs_server, BaseException):
+                await logger.aerror(
+                    f"Could not add starter projects MCP server for user {user.username}: {needs_server}"
                 )
+                continue
+            if needs_server is not True:
+                continue
+            default_auth = await _get_starter_folder_auth(user, folder_by_user[user.id], settings_service)
+            if default_auth.get("auth_type", "none") == "oauth":
+                msg = "OAuth authentication is not yet implemented for MCP server creation during project creation."
+                await logger.aerror(f"Could not add starter projects MCP server for user {user.username}: {msg}")
+                continue
+            pending_users.append(user)
+            auth_by_user[user.id] = default_auth
 
-                # Skip if server already exists for this starter projects folder
-                if validation_result.should_skip:
-                    await logger.adebug(
-                        f"MCP server '{validation_result.server_name}' already exists for user "
-                        f"{user.username}'s starter projects (project ID: "
-                        f"{user_starter_folder.id}), skipping"
-                    )
-                    continue  # Skip this user since server already exists for the same project
-
-                server_name = validation_result.server_name
-
-                # Set up THIS USER'S starter folder authentication (same as new projects)
-                # If AUTO_LOGIN is false, automatically enable API key authentication
-                default_auth = {"auth_type": "none"}
-                await logger.adebug(f"Settings service auth settings: {settings_service.auth_settings}")
-                await logger.adebug(f"User starter folder auth settings: {user_starter_folder.auth_settings}")
-                if not settings_service.auth_settings.AUTO_LOGIN and not user_starter_folder.auth_settings:
-                    default_auth = {"auth_type": "apikey"}
-                    user_starter_folder.auth_settings = encrypt_auth_settings(default_auth)
-                    await logger.adebug(f"Set up auth settings for user {user.username}'s starter folder")
-                elif user_starter_folder.auth_settings:
-                    default_auth = user_starter_folder.auth_settings
-
-                # Create API key for this user to access their own starter projects
-                api_key_name = f"MCP Project {DEFAULT_FOLDER_NAME} - {user.username}"
-                unmasked_api_key = await create_api_key(session, ApiKeyCreate(name=api_key_name), user.id)
-
-                # Build SSE URL for THIS USER'S starter folder (unique ID per user)
-                sse_url = await get_project_sse_url(user_starter_folder.id)
-
-                # Prepare server config (similar to new project creation)
-                if default_auth.get("auth_type", "none") == "apikey":
-                    command = "uvx"
-                    args = [
-                        "mcp-proxy",
-                        "--headers",
-                        "x-api-key",
-                        unmasked_api_key.api_key,
-                        sse_url,
-                    ]
-                elif default_auth.get("auth_type", "none") == "oauth":
-                    msg = "OAuth authentication is not yet implemented for MCP server creation during project creation."
-                    logger.warning(msg)
-                    raise HTTPException(status_code=501, detail=msg)
-                else:  # default_auth_type == "none"
-                    # No authentication - direct connection
-                    command = "uvx"
-                    args = [
-                        "mcp-proxy",
-                        sse_url,
-                    ]
-                server_config = {"command": command, "args": args}
-
-                # Add to user's MCP servers configuration
-                await logger.adebug(f"Adding MCP server '{server_name}' for user {user.username}")
-                await update_server(
-                    server_name,
-                    server_config,
+        # Persist the starter folders' auth settings before the per-user sessions run
+        await session.commit()
+
+        # Create the API keys for all users to access their own starter projects, skipping users it fails for
+        api_key_by_user = await _create_starter_api_keys(pending_users)
+        pending_users = [user for user in pending_users if user.id in api_key_by_user]
+
+        # Add starter projects to each pending user's MCP server configuration concurrently
+        results = await asyncio.gather(
+            *(
+                _add_starter_server(
                     user,
-                    session,
-                    get_storage_service(),
+                    folder_by_user[user.id],
+                    server_name,
+                    auth_by_user[user.id],
+                    api_key_by_user[user.id],
                     settings_service,
+                    semaphore,
                 )
-
+                for user in pending_users
+            ),
+            return_exceptions=True,
+        )
+        total_servers_added = 0
+        for user, added in zip(pending_users, results, strict=True):
+            if isinstance(added, BaseException):
+                await logger.aerror(f"Could not add starter projects MCP server for user {user.username}: {added}")
+            elif added is True:
                 total_servers_added += 1
-                await logger.adebug(f"Added starter projects MCP server for user: {user.username}")
-
-            except Exception as e:  # noqa: BLE001
-                # If server already exists or other issues, just log and continue
-                await logger.aerror(f"Could not add starter projects MCP server for user {user.username}: {e}")
-                continue
 
         await session.commit()
 
@@ -409,15 +595,10 @@ async def extract_urls_from_strings(strings: list[str]) -> list[str]:
     Returns:
         List of URLs found in the input strings
     """
-    import re
-
-    # URL pattern to match http/https URLs
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+[^\s<>"{}|\\^`\[\].,;:!?]'
-
     urls = []
     for string in strings:
         if isinstance(string, str):
-            found_urls = re.findall(url_pattern, string)
+            found_urls = URL_PATTERN.findall(string)
             urls.extend(found_urls)
 
     return urls
@@ -20,6 +20,7 @@ from lfx.log import logger
 from lfx.services.deps import get_settings_service, session_scope
 from lfx.services.mcp_composer.service import MCPComposerError, MCPComposerService
 from lfx.services.schema import ServiceType
+from lfx.services.settings.constants import ALL_INTERFACES_HOST
 from mcp import types
 from mcp.server import NotificationOptions, Server
 from mcp.server.sse import SseServerTransport
@@ -55,9 +56,6 @@ from langflow.services.database.models.user.crud import get_user_by_username
 from langflow.services.database.models.user.model import User
 from langflow.services.deps import get_service
 
-# Constants
-ALL_INTERFACES_HOST = "0.0.0.0"  # noqa: S104
-
 router = APIRouter(prefix="/mcp/project", tags=["mcp_projects"])
 
 
@@ -22,22 +22,48 @@ async def get_api_keys(session: AsyncSession, user_id: UUID) -> list[ApiKeyRead]
 
 
 async def create_api_key(session: AsyncSession, api_key_create: ApiKeyCreate, user_id: UUID) -> UnmaskedApiKeyRead:
-    # Generate a random API key with 32 bytes of randomness
-    generated_api_key = f"sk-{secrets.token_urlsafe(32)}"
+    return (await create_api_keys(session, [(api_key_create, user_id)]))[0]
 
-    api_key = ApiKey(
-        api_key=generated_api_key,
-        name=api_key_create.name,
-        user_id=user_id,
-        created_at=api_key_create.created_at or datetime.datetime.now(datetime.timezone.utc),
-    )
 
-    session.add(api_key)
+async def create_api_keys(
+    session: AsyncSession, api_keys_create: list[tuple[ApiKeyCreate, UUID]]
+) -> list[UnmaskedApiKeyRead]:
+    """Create several API keys in a single transaction.
+
+    Args:
+        session: Database session
+        api_keys_create: Pairs of API key definitions and the ID of the user owning each key
+
+    Returns:
+        The unmasked API keys, in the same order as api_keys_create
+    """
+    api_keys = []
+    generated_api_keys = []
+    for api_key_create, user_id in api_keys_create:
+        # Generate a random API key with 32 bytes of randomness
+        generated_api_key = f"sk-{secrets.token_urlsafe(32)}"
+        generated_api_keys.append(generated_api_key)
+        api_keys.append(
+            ApiKey(
+                api_key=generated_api_key,
+                name=api_key_create.name,
+                user_id=user_id,
+                created_at=api_key_create.created_at or datetime.datetime.now(datetime.timezone.utc),
+            )
+        )
+
+    if not api_keys:
+        return []
+
+    session.add_all(api_keys)
     await session.commit()
-    await session.refresh(api_key)
-    unmasked = UnmaskedApiKeyRead.model_validate(api_key, from_attributes=True)
-    unmasked.api_key = generated_api_key
-    return unmasked
+
+    unmasked_api_keys = []
+    for api_key, generated_api_key in zip(api_keys, generated_api_keys, strict=True):
+        unmasked = UnmaskedApiKeyRead.model_validate(api_key, from_attributes=True)
+        unmasked.api_key = generated_api_key
+        unmasked_api_keys.append(unmasked)
+    return unmasked_api_keys
 
 
 async def delete_api_key(session: AsyncSession, api_key_id: UUID) -> None:
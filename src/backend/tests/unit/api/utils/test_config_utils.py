@@ -1,18 +1,26 @@
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient
 from langflow.api.utils.mcp.config_utils import (
     MCPServerValidationResult,
+    _is_wsl,
+    _wsl_ip_cache,
     auto_configure_starter_projects_mcp,
+    get_url_by_os,
     validate_mcp_server_for_project,
 )
+from langflow.api.v2.mcp import get_server_list
+from langflow.services.auth.mcp_encryption import encrypt_auth_settings
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
 from langflow.services.database.models.folder.model import Folder
 from langflow.services.database.models.user.model import User
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_storage_service, session_scope
+from lfx.base.mcp.constants import MAX_MCP_SERVER_NAME_LENGTH
+from lfx.base.mcp.util import sanitize_mcp_name
 from sqlmodel import select
 
 
@@ -44,6 +52,13 @@ class TestMCPServerValidationResult:
         assert result.existing_config == config
         assert result.conflict_message == "Test conflict"
 
+    def test_uses_slots(self):
+        """Test that instances don't carry a per-instance __dict__."""
+        result = MCPServerValidationResult(server_exists=False, project_id_matches=False)
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unknown_attribute = True
+
     def test_has_conflict_property(self):
         """Test the has_conflict property."""
         # No conflict when server doesn't exist
@@ -275,6 +290,69 @@ class TestValidateMcpServerForProject:
                 assert result.existing_config is None
                 assert result.conflict_message == ""
 
+    @pytest.mark.asyncio
+    async def test_validate_server_with_existing_servers(self, active_user, test_project, client: AsyncClient):  # noqa: ARG002
+        """Test validation uses the provided server list instead of fetching it."""
+        from langflow.services.deps import get_settings_service, get_storage_service
+
+        existing_servers = {
+            "mcpServers": {
+                "lf-test_project": {
+                    "command": "uvx",
+                    "args": ["mcp-proxy", f"http://localhost:7860/api/v1/mcp/project/{test_project.id}/sse"],
+                }
+            }
+        }
+
+        async with session_scope() as session:
+            storage_service = get_storage_service()
+            settings_service = get_settings_service()
+
+            with patch("langflow.api.utils.mcp.config_utils.get_server_list") as mock_get_server_list:
+                result = await validate_mcp_server_for_project(
+                    test_project.id,
+                    test_project.name,
+                    active_user,
+                    session,
+                    storage_service,
+                    settings_service,
+                    existing_servers=existing_servers,
+                )
+
+                mock_get_server_list.assert_not_called()
+                assert result.server_exists is True
+                assert result.project_id_matches is True
+                assert result.should_skip is True
+
+    @pytest.mark.asyncio
+    async def test_validate_server_project_id_only_elsewhere_in_url(
+        self,
+        active_user,
+        test_project,
+        client: AsyncClient,  # noqa: ARG002
+    ):
+        """Test that the project ID must be the URL's project segment to match."""
+        from langflow.services.deps import get_settings_service, get_storage_service
+
+        other_project_id = uuid4()
+        sse_url = f"http://localhost:7860/api/v1/mcp/project/{other_project_id}/sse?ref={test_project.id}"
+        existing_servers = {"mcpServers": {"lf-test_project": {"command": "uvx", "args": ["mcp-proxy", sse_url]}}}
+
+        async with session_scope() as session:
+            result = await validate_mcp_server_for_project(
+                test_project.id,
+                test_project.name,
+                active_user,
+                session,
+                get_storage_service(),
+                get_settings_service(),
+                existing_servers=existing_servers,
+            )
+
+            assert result.server_exists is True
+            assert result.project_id_matches is False
+            assert result.has_conflict is True
+
 
 class TestAutoConfigureStarterProjectsMcp:
     """Test the auto_configure_starter_projects_mcp function using real API calls."""
@@ -414,6 +492,47 @@ class TestAutoConfigureStarterProjectsMcp:
                 # Restore original setting
                 settings_service.settings.add_projects_to_mcp_servers = original_setting
 
+    @pytest.mark.asyncio
+    async def test_auto_configure_with_pending_changes_without_auto_login(
+        self,
+        sample_user_with_starter_project,
+        client: AsyncClient,  # noqa: ARG002
+    ):
+        """Test that servers are added when AUTO_LOGIN is off and the caller's session has uncommitted changes."""
+        from langflow.services.deps import get_settings_service
+
+        user, starter_folder, _ = sample_user_with_starter_project
+        settings_service = get_settings_service()
+        original_setting = settings_service.settings.add_projects_to_mcp_servers
+        original_auto_login = settings_service.auth_settings.AUTO_LOGIN
+
+        try:
+            settings_service.settings.add_projects_to_mcp_servers = True
+            settings_service.auth_settings.AUTO_LOGIN = False
+
+            async with session_scope() as session:
+                # Stage an uncommitted project auth change, as init_mcp_servers does before auto-configuring
+                folder = await session.get(Folder, starter_folder.id)
+                folder.auth_settings = encrypt_auth_settings({"auth_type": "apikey"})
+                session.add(folder)
+
+                await auto_configure_starter_projects_mcp(session)
+
+            async with session_scope() as session:
+                server_list = await get_server_list(user, session, get_storage_service(), settings_service)
+                updated_folder = await session.get(Folder, starter_folder.id)
+
+        finally:
+            settings_service.settings.add_projects_to_mcp_servers = original_setting
+            settings_service.auth_settings.AUTO_LOGIN = original_auto_login
+
+        server_name = f"lf-{sanitize_mcp_name(DEFAULT_FOLDER_NAME)[: (MAX_MCP_SERVER_NAME_LENGTH - 4)]}"
+        assert server_name in server_list["mcpServers"]
+        server_args = server_list["mcpServers"][server_name]["args"]
+        assert "x-api-key" in server_args
+        assert server_args[-1].endswith(f"/api/v1/mcp/project/{starter_folder.id}/sse")
+        assert updated_folder.auth_settings["auth_type"] == "apikey"
+
     @pytest.mark.asyncio
     async def test_auto_configure_user_without_starter_folder(self, client: AsyncClient):  # noqa: ARG002
         """Test auto-configure for user without starter folder."""
@@ -735,3 +854,122 @@ class TestMCPWithDefaultFolderName:
                 if user_to_delete:
                     await session.delete(user_to_delete)
                 await session.commit()
+
+
+def _fake_hostname_process(stdout: bytes, returncode: int = 0) -> MagicMock:
+    """Build a stand-in for the `hostname -I` subprocess, whose exit status is only known once it has finished."""
+    proc = MagicMock()
+    proc.returncode = None
+
+    async def communicate():
+        await asyncio.sleep(0)  # Yield so concurrent lookups can pile up on the lock
+        proc.returncode = returncode
+        return stdout, None
+
+    proc.communicate = AsyncMock(side_effect=communicate)
+    return proc
+
+
+class TestGetUrlByOs:
+    """Test the WSL URL rewriting and its cached IP lookup."""
+
+    LOCAL_URL = "http://localhost:7860/api/v1/mcp/project/123/sse"
+
+    @pytest.fixture(autouse=True)
+    def reset_wsl_caches(self):
+        """Start and end every test without a cached WSL detection or IP address."""
+        _wsl_ip_cache.clear()
+        _is_wsl.cache_clear()
+        yield
+        _wsl_ip_cache.clear()
+        _is_wsl.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_url_unchanged_outside_wsl(self):
+        """Test that no lookup happens when not running under WSL."""
+        with (
+            patch("langflow.api.utils.mcp.config_utils._is_wsl", return_value=False),
+            patch("langflow.api.utils.mcp.config_utils.create_subprocess_exec", new=AsyncMock()) as mock_exec,
+        ):
+            url = await get_url_by_os("localhost", 7860, self.LOCAL_URL)
+
+        assert url == self.LOCAL_URL
+        mock_exec.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_url_rewritten_with_wsl_ip(self):
+        """Test that localhost is replaced with the first WSL IP address."""
+        proc = _fake_hostname_process(b"172.20.1.2 10.0.0.1 \n")
+        with (
+            patch("langflow.api.utils.mcp.config_utils._is_wsl", return_value=True),
+            patch("langflow.api.utils.mcp.config_utils.create_subprocess_exec", new=AsyncMock(return_value=proc)),
+        ):
+            url = await get_url_by_os("localhost", 7860, self.LOCAL_URL)
+
+        assert url == "http://172.20.1.2:7860/api/v1/mcp/project/123/sse"
+
+    @pytest.mark.asyncio
+    async def test_wsl_ip_looked_up_once_for_concurrent_calls(self):
+        """Test that concurrent calls spawn the hostname subprocess only once."""
+        proc = _fake_hostname_process(b"172.20.1.2\n")
+        with (
+            patch("langflow.api.utils.mcp.config_utils._is_wsl", return_value=True),
+            patch(
+                "langflow.api.utils.mcp.config_utils.create_subprocess_exec", new=AsyncMock(return_value=proc)
+            ) as mock_exec,
+        ):
+            urls = await asyncio.gather(*(get_url_by_os("127.0.0.1", 7860, "http://127.0.0.1:7860/") for _ in range(5)))
+            # Later calls are served from the cache as well
+            urls.append(await get_url_by_os("localhost", 7860, self.LOCAL_URL))
+
+        assert urls[:5] == ["http://172.20.1.2:7860/"] * 5
+        assert urls[5] == "http://172.20.1.2:7860/api/v1/mcp/project/123/sse"
+        mock_exec.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_wsl_ip_lookup_not_cached(self):
+        """Test that a failed lookup keeps the URL and is retried on the next call."""
+        proc = _fake_hostname_process(b"172.20.1.2\n")
+        with (
+            patch("langflow.api.utils.mcp.config_utils._is_wsl", return_value=True),
+            patch(
+                "langflow.api.utils.mcp.config_utils.create_subprocess_exec",
+                new=AsyncMock(side_effect=[OSError("hostname not found"), proc]),
+            ) as mock_exec,
+        ):
+            first_url = await get_url_by_os("localhost", 7860, self.LOCAL_URL)
+            assert "ip" not in _wsl_ip_cache
+            second_url = await get_url_by_os("localhost", 7860, self.LOCAL_URL)
+
+        assert first_url == self.LOCAL_URL
+        assert second_url == "http://172.20.1.2:7860/api/v1/mcp/project/123/sse"
+        assert mock_exec.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_hostname_exit_not_cached(self):
+        """Test that output of a hostname call exiting with an error is ignored and not cached."""
+        proc = _fake_hostname_process(b"hostname: invalid option -- 'I'\n", returncode=1)
+        with (
+            patch("langflow.api.utils.mcp.config_utils._is_wsl", return_value=True),
+            patch("langflow.api.utils.mcp.config_utils.create_subprocess_exec", new=AsyncMock(return_value=proc)),
+        ):
+            url = await get_url_by_os("localhost", 7860, self.LOCAL_URL)
+
+        assert url == self.LOCAL_URL
+        assert "ip" not in _wsl_ip_cache
+
+    @pytest.mark.asyncio
+    async def test_hostname_exit_status_collected_after_output_is_accepted(self):
+        """Test that the address is cached when hostname's exit status is only known after it has finished."""
+        proc = _fake_hostname_process(b"172.20.1.2 10.0.0.1\n")
+        with (
+            patch("langflow.api.utils.mcp.config_utils._is_wsl", return_value=True),
+            patch("langflow.api.utils.mcp.config_utils.create_subprocess_exec", new=AsyncMock(return_value=proc)),
+        ):
+            url = await get_url_by_os("localhost", 7860, self.LOCAL_URL)
+
+        proc.communicate.assert_awaited_once()
+        proc.terminate.assert_not_called()
+        assert proc.returncode == 0
+        assert url == "http://172.20.1.2:7860/api/v1/mcp/project/123/sse"
+        assert _wsl_ip_cache["ip"] == "172.20.1.2"
@@ -1,6 +1,9 @@
 import pytest
 from httpx import AsyncClient
 from langflow.services.database.models.api_key import ApiKeyCreate
+from langflow.services.database.models.api_key.crud import create_api_key, create_api_keys
+from langflow.services.database.models.api_key.model import ApiKey
+from langflow.services.deps import session_scope
 
 
 @pytest.fixture
@@ -47,3 +50,33 @@ async def test_delete_api_key(client, logged_in_headers, api_key):
     data = response.json()
     assert data["detail"] == "API Key deleted"
     # Optionally, add a follow-up check to ensure that the key is actually removed from the database
+
+
+async def test_create_api_keys_preserves_order(active_user):
+    names = ["first-api-key", "second-api-key", "third-api-key"]
+    async with session_scope() as session:
+        unmasked_api_keys = await create_api_keys(
+            session, [(ApiKeyCreate(name=name), active_user.id) for name in names]
+        )
+
+        assert [api_key.name for api_key in unmasked_api_keys] == names
+        assert len({api_key.api_key for api_key in unmasked_api_keys}) == len(names)
+        for unmasked_api_key in unmasked_api_keys:
+            stored_api_key = await session.get(ApiKey, unmasked_api_key.id)
+            assert stored_api_key.api_key == unmasked_api_key.api_key
+            assert stored_api_key.user_id == active_user.id
+
+
+async def test_create_api_keys_empty(active_user):  # noqa: ARG001
+    async with session_scope() as session:
+        assert await create_api_keys(session, []) == []
+
+
+async def test_create_api_key_is_unmasked(active_user):
+    async with session_scope() as session:
+        unmasked_api_key = await create_api_key(session, ApiKeyCreate(name="single-api-key"), active_user.id)
+
+        assert unmasked_api_key.api_key.startswith("sk-")
+        stored_api_key = await session.get(ApiKey, unmasked_api_key.id)
+        assert stored_api_key.api_key == unmasked_api_key.api_key
+        assert stored_api_key.name == "single-api-key"
@@ -8,6 +8,7 @@ import re
 import shutil
 import unicodedata
 from collections.abc import Awaitable, Callable
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlparse
 from uuid import UUID
@@ -123,6 +124,7 @@ def validate_headers(headers: dict[str, str]) -> dict[str, str]:
     return sanitized_headers
 
 
+@lru_cache(maxsize=256)
 def sanitize_mcp_name(name: str, max_length: int = 46) -> str:
     """Sanitize a name for MCP usage by removing emojis, diacritics, and special characters.
 
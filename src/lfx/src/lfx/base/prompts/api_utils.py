@@ -1,4 +1,5 @@
 from collections import defaultdict
+from functools import lru_cache
 from typing import Any
 
 from fastapi import HTTPException
@@ -122,7 +123,13 @@ def _check_input_variables(input_variables):
     return fixed_variables
 
 
-def validate_prompt(prompt_template: str, *, silent_errors: bool = False) -> list[str]:
+@lru_cache(maxsize=512)
+def _extract_valid_input_variables(prompt_template: str) -> tuple[str, ...]:
+    """Extract and check the input variables of a prompt template.
+
+    The result only depends on the template text, so it is cached to avoid re-parsing
+    the same template on every frontend node update.
+    """
     input_variables = extract_input_variables_from_prompt(prompt_template)
 
     # Check if there are invalid characters in the input_variables
@@ -131,6 +138,12 @@ def validate_prompt(prompt_template: str, *, silent_errors: bool = False) -> lis
         msg = f"Invalid input variables. None of the variables can be named {', '.join(input_variables)}. "
         raise ValueError(msg)
 
+    return tuple(input_variables)
+
+
+def validate_prompt(prompt_template: str, *, silent_errors: bool = False) -> list[str]:
+    input_variables = list(_extract_valid_input_variables(prompt_template))
+
     try:
         PromptTemplate(template=prompt_template, input_variables=input_variables)
     except Exception as exc:
@@ -179,18 +192,19 @@ def add_new_variables_to_template(input_variables, custom_fields, template, name
 
 
 def remove_old_variables_from_template(old_custom_fields, input_variables, custom_fields, template, name) -> None:
-    for variable in old_custom_fields:
-        if variable not in input_variables:
-            try:
-                # Remove the variable from custom_fields associated with the given name
-                if variable in custom_fields[name]:
-                    custom_fields[name].remove(variable)
-
-                # Remove the variable from the template
-                template.pop(variable, None)
-
-            except Exception as exc:
-                raise HTTPException(status_code=500, detail=str(exc)) from exc
+    removed_variables = set(old_custom_fields).difference(input_variables)
+    if not removed_variables:
+        return
+    try:
+        # Remove the variables from custom_fields associated with the given name
+        custom_fields[name][:] = [variable for variable in custom_fields[name] if variable not in removed_variables]
+
+        # Remove the variables from the template
+        for variable in removed_variables:
+            template.pop(variable, None)
+
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 def update_input_variables_field(input_variables, template) -> None:
@@ -36,9 +36,9 @@ class PromptComponent(Component):
         return prompt
 
     def _update_template(self, frontend_node: dict):
-        prompt_template = frontend_node["template"]["template"]["value"]
-        custom_fields = frontend_node["custom_fields"]
         frontend_node_template = frontend_node["template"]
+        prompt_template = frontend_node_template["template"]["value"]
+        custom_fields = frontend_node["custom_fields"]
         _ = process_prompt_template(
             template=prompt_template,
             name="template",
@@ -50,13 +50,14 @@ class PromptComponent(Component):
     async def update_frontend_node(self, new_frontend_node: dict, current_frontend_node: dict):
         """This function is called after the code validation is done."""
         frontend_node = await super().update_frontend_node(new_frontend_node, current_frontend_node)
-        template = frontend_node["template"]["template"]["value"]
+        frontend_node_template = frontend_node["template"]
+        template = frontend_node_template["template"]["value"]
         # Kept it duplicated for backwards compatibility
         _ = process_prompt_template(
             template=template,
             name="template",
             custom_fields=frontend_node["custom_fields"],
-            frontend_node_template=frontend_node["template"],
+            frontend_node_template=frontend_node_template,
         )
         # Now that template is updated, we need to grab any values that were set in the current_frontend_node
         # and update the frontend_node with those values
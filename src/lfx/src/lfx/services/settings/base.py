@@ -17,7 +17,7 @@ from typing_extensions import override
 from lfx.constants import BASE_COMPONENTS_PATH
 from lfx.log.logger import logger
 from lfx.serialization.constants import MAX_ITEMS_LENGTH, MAX_TEXT_LENGTH
-from lfx.services.settings.constants import VARIABLES_TO_GET_FROM_ENVIRONMENT
+from lfx.services.settings.constants import ALL_INTERFACES_HOST, VARIABLES_TO_GET_FROM_ENVIRONMENT
 from lfx.utils.util_strings import is_valid_database_url
 
 
@@ -572,6 +572,19 @@ class Settings(BaseSettings):
                 logger.debug(f"Updated {key}")
             logger.debug(f"{key}: {getattr(self, key)}")
 
+    @property
+    def effective_mcp_host(self) -> str:
+        """The host MCP clients should connect to.
+
+        0.0.0.0 is a bind address, not a connect address, so localhost is used instead.
+        """
+        return "localhost" if self.host == ALL_INTERFACES_HOST else self.host
+
+    @property
+    def effective_mcp_port(self) -> int:
+        """The port MCP clients should connect to, preferring the port detected at runtime."""
+        return self.runtime_port or self.port or 7860
+
     @property
     def voice_mode_available(self) -> bool:
         """Check if voice mode is available by testing webrtcvad import."""
@@ -2,6 +2,8 @@ from pydantic import SecretStr
 
 DEFAULT_SUPERUSER = "langflow"
 DEFAULT_SUPERUSER_PASSWORD = SecretStr("langflow")
+# Bind address for all interfaces, which clients cannot connect to
+ALL_INTERFACES_HOST = "0.0.0.0"
 
 VARIABLES_TO_GET_FROM_ENVIRONMENT = [
     "COMPOSIO_API_KEY",
@@ -0,0 +1,44 @@
+"""Tests for remove_old_variables_from_template."""
+
+import pytest
+from fastapi import HTTPException
+
+from lfx.base.prompts.api_utils import remove_old_variables_from_template
+
+
+def test_removes_variables_from_custom_fields_and_template():
+    custom_fields = {"template": ["first", "removed", "second", "other_removed", "third"]}
+    template = {"first": {}, "removed": {}, "second": {}, "other_removed": {}, "third": {}, "code": {}}
+
+    remove_old_variables_from_template(
+        old_custom_fields=["first", "removed", "second", "other_removed", "third"],
+        input_variables=["first", "second", "third"],
+        custom_fields=custom_fields,
+        template=template,
+        name="template",
+    )
+
+    assert custom_fields["template"] == ["first", "second", "third"]
+    assert list(template) == ["first", "second", "third", "code"]
+
+
+def test_keeps_custom_fields_list_object():
+    retained = ["first", "removed"]
+    custom_fields = {"template": retained}
+
+    remove_old_variables_from_template(["first", "removed"], ["first"], custom_fields, {"removed": {}}, "template")
+
+    assert custom_fields["template"] is retained
+    assert retained == ["first"]
+
+
+def test_missing_name_raises_only_when_variables_are_removed():
+    template = {"first": {}}
+
+    # Nothing to remove, so the missing custom fields entry is never looked up
+    remove_old_variables_from_template(["first"], ["first", "new"], {}, template, "template")
+    assert template == {"first": {}}
+
+    with pytest.raises(HTTPException) as exc_info:
+        remove_old_variables_from_template(["first", "removed"], ["first"], {}, {"removed": {}}, "template")
+    assert exc_info.value.status_code == 500
@@ -0,0 +1,28 @@
+"""Tests for the effective MCP host and port in Settings."""
+
+from lfx.services.settings.base import Settings
+from lfx.services.settings.constants import ALL_INTERFACES_HOST
+
+
+def test_all_interfaces_host_uses_localhost():
+    """Test that the all-interfaces bind address is replaced with localhost."""
+    settings = Settings(host=ALL_INTERFACES_HOST)
+    assert settings.effective_mcp_host == "localhost"
+
+
+def test_specific_host_is_preserved():
+    """Test that a specific host is used as-is."""
+    settings = Settings(host="192.168.1.10")
+    assert settings.effective_mcp_host == "192.168.1.10"
+
+
+def test_runtime_port_wins_over_port():
+    """Test that the port detected at runtime takes precedence over the configured port."""
+    settings = Settings(port=7860, runtime_port=7861)
+    assert settings.effective_mcp_port == 7861
+
+
+def test_configured_port_used_without_runtime_port():
+    """Test that the configured port is used when no runtime port was detected."""
+    settings = Settings(port=8080)
+    assert settings.effective_mcp_port == 8080